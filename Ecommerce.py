@@ -3,133 +3,65 @@
 # Objetivo: fornecer somente as estruturas básicas + comentários orientando a implementação.
 # Observações didáticas:
 # - Para valores monetários, prefira 'decimal.Decimal' a 'float' (precisão).
-# - IDs podem ser gerados com uuid.uuid4().
+# - IDs podem ser gerados com uuid.uuid4() (aqui: os.urandom(16).hex(), mais barato).
 # - Se desejar, adicione validações (ex.: CPF, email) como extensão.
+# - As classes de domínio ficam em models.py (compiláveis com mypyc).
 
-import uuid                     # gerar identificadores únicos (UUID)
+import io                       # montagem do relatório em memória
+import sys                      # escrita bufferizada no stdout
+from array import array         # buffers int64 compactos (fallback sem numpy)
 from decimal import Decimal     # representação apropriada de dinheiro
-from typing import List, Dict   # anotações de tipo (listas e dicionários)
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar, Union  # anotações de tipo (listas e dicionários)
 
+from models import Pessoa, Cliente, Produto, ItemPedido, Pedido, format_money
 
-# =========================
-# CLASSE PESSOA
-# =========================
-class Pessoa:
-    """
-    Representa uma pessoa com atributos básicos.
-    Atributos obrigatórios: nome, cpf, email.
-
-    Tarefas do aluno:
-    - Implementar o construtor (__init__) atribuindo os atributos.
-    - (Opcional) Validar CPF / email.
-    - (Opcional) Criar __str__/__repr__ para facilitar a depuração.
-    """
-
-    def __init__(self, nome: str, cpf: str, email: str) -> None:
-        self.nome = nome
-        self.cpf = cpf
-        self.email = email
-
-    def __repr__(self):
-        return f"Pessoa(nome={self.nome}, cpf={self.cpf}, email={self.email})"
-
-
-# =========================
-# CLASSE CLIENTE
-# =========================
-class Cliente:
-    """
-    Representa um cliente do e-commerce, associado a uma Pessoa.
-    Atributos: pessoa (objeto Pessoa), id_cliente (str).
-
-    Tarefas do aluno:
-    - Implementar o construtor recebendo uma Pessoa.
-    - Gerar id_cliente com str(uuid.uuid4()).
-    - (Opcional) Criar __str__/__repr__.
-    """
-
-    def __init__(self, pessoa: Pessoa) -> None:
-        self.pessoa = pessoa
-        self.id_cliente = str(uuid.uuid4())
-
-    def __repr__(self):
-        return f"Cliente(id_cliente={self.id_cliente}, pessoa={self.pessoa})"
-
-
-# =========================
-# CLASSE PRODUTO
-# =========================
-class Produto:
-    """
-    Representa um produto disponível para venda.
-    Atributos: nome (str), preco (Decimal), estoque (int).
-
-    Tarefas do aluno:
-    - Implementar o construtor e armazenar os atributos.
-    - (Opcional) Validar: preco >= 0 e estoque >= 0.
-    - (Opcional) Criar __str__/__repr__.
-    - (Opcional) Métodos utilitários (ex.: pode_atender, debitar, creditar) se o enunciado pedir.
-    """
+# Dependências opcionais para relatórios em lote (numpy + numba).
+# Sem elas, o mesmo kernel roda como Python puro sobre array.array.
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
 
-    def __init__(self, nome: str, preco: Decimal, estoque: int) -> None:
-        if preco < 0 or estoque < 0:
-            raise ValueError("Preço e estoque devem ser não-negativos.")
-        self.nome = nome
-        self.preco = preco
-        self.estoque = estoque
+_F = TypeVar("_F", bound=Callable[..., Any])
 
-    def __repr__(self):
-        return f"Produto(nome={self.nome}, preco={self.preco}, estoque={self.estoque})"
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args: Any, **kwargs: Any) -> Callable[[_F], _F]:  # type: ignore[no-redef]
+        def decorador(func: _F) -> _F:
+            return func
+        return decorador
 
 
-# =========================
-# CLASSE ITEMPEDIDO
-# =========================
-class ItemPedido:
-    """
-    Representa um item dentro de um pedido (produto + quantidade).
-    Atributos: produto (Produto), quantidade (int).
-
-    Tarefas do aluno:
-    - Implementar o construtor.
-    - Implementar calcular_total() = produto.preco * quantidade.
-    """
+# Texto do menu montado uma única vez e emitido com uma só escrita por ciclo.
+_MENU_BANNER = (
+    "\n--- Menu E-commerce ---\n"
+    "1. Cadastrar cliente\n"
+    "2. Cadastrar produto\n"
+    "3. Criar pedido\n"
+    "4. Listar pedidos\n"
+    "0. Sair\n"
+)
 
-    def __init__(self, produto: Produto, quantidade: int) -> None:
-        if quantidade <= 0:
-            raise ValueError("Quantidade deve ser maior que zero.")
-        self.produto = produto
-        self.quantidade = quantidade
 
-    def calcular_total(self) -> Decimal:
-        return self.produto.preco * Decimal(self.quantidade)
-
-
-# =========================
-# CLASSE PEDIDO
-# =========================
-class Pedido:
+@njit(cache=True)
+def _sum_totals(prices_cents: Any, qtys: Any, offsets: Any, out: Any) -> Any:
     """
-    Representa um pedido realizado por um cliente.
-    Atributos: cliente (Cliente), itens (List[ItemPedido]).
-
-    Tarefas do aluno:
-    - Implementar o construtor inicializando a lista de itens vazia.
-    - Implementar adicionar_item(produto, quantidade): cria ItemPedido e adiciona à lista.
-    - Implementar calcular_total(): soma dos totais dos itens.
-    - (Opcional) confirmar(): validar estoques e debitar (se fizer parte do enunciado).
+    Soma, por pedido, preco_cents * quantidade dos itens.
+    Os itens do pedido p ocupam prices_cents/qtys[offsets[p]:offsets[p + 1]];
+    o total (centavos) de cada pedido é gravado em out[p].
     """
+    for p in range(len(offsets) - 1):
+        s = 0
+        for i in range(offsets[p], offsets[p + 1]):
+            s += prices_cents[i] * qtys[i]
+        out[p] = s
+    return out
 
-    def __init__(self, cliente: Cliente) -> None:
-        self.cliente = cliente
-        self.itens: List[ItemPedido] = []
 
-    def adicionar_item(self, produto: Produto, quantidade: int) -> None:
-        item = ItemPedido(produto, quantidade)
-        self.itens.append(item)
-
-    def calcular_total(self) -> Decimal:
-        return sum(item.calcular_total() for item in self.itens)
+def _out(texto: str) -> None:
+    """Escreve no stdout sem flush; o flush fica para os pontos de interação."""
+    sys.stdout.write(texto)
 
 
 # =========================
@@ -152,33 +84,88 @@ class Menu:
     def __init__(self) -> None:
         self.clientes: Dict[str, Cliente] = {}
         self.produtos: Dict[str, Produto] = {}
+        # Lista paralela a self.produtos (mesma ordem), usada para exibição do catálogo.
+        self._produtos_list: List[Tuple[str, Produto]] = []
+        # Posição de cada nome em _produtos_list (recadastro em O(1)).
+        self._produtos_idx: Dict[str, int] = {}
         self.pedidos: List[Pedido] = []
+        # Despacho das opções do menu: uma consulta ao dicionário por escolha.
+        self._actions: Dict[str, Callable[[], None]] = {
+            "1": self._menu_cad_cliente,
+            "2": self._menu_cad_produto,
+            "3": self._menu_criar_pedido,
+            "4": self.listar_pedidos,
+            "0": self._menu_exit,
+        }
+        self._executando = False
+
+    def _add_cliente(self, pessoa: Pessoa) -> Cliente:
+        # Inserção pura (sem saída) no dicionário de clientes.
+        cliente = Cliente(pessoa)
+        self.clientes[pessoa.cpf] = cliente
+        return cliente
+
+    def _add_produto(self, nome: str, preco: Union[Decimal, str, int], estoque: int) -> Produto:
+        produto = Produto(sys.intern(nome), preco, estoque)
+        self._store_produto(produto)
+        return produto
+
+    def _store_produto(self, produto: Produto) -> None:
+        # Grava um Produto já validado no dicionário e na lista do catálogo.
+        nome = produto.nome
+        indice = self._produtos_idx.get(nome)
+        if indice is None:
+            self._produtos_idx[nome] = len(self._produtos_list)
+            self._produtos_list.append((nome, produto))
+        else:
+            # Recadastro: substitui a entrada existente mantendo a posição.
+            self._produtos_list[indice] = (nome, produto)
+        self.produtos[nome] = produto
 
     def cadastrar_cliente(self, nome: str, cpf: str, email: str) -> None:
-        pessoa = Pessoa(nome, cpf, email)
-        cliente = Cliente(pessoa)
-        self.clientes[cpf] = cliente
+        cliente = self._add_cliente(Pessoa(nome, cpf, email))
         print(f"Cliente cadastrado: {cliente}")
 
-    def cadastrar_produto(self, nome: str, preco: Decimal, estoque: int) -> None:
-        produto = Produto(nome, preco, estoque)
-        self.produtos[nome] = produto
+    def cadastrar_produto(self, nome: str, preco: Union[Decimal, str, int], estoque: int) -> None:
+        produto = self._add_produto(nome, preco, estoque)
         print(f"Produto cadastrado: {produto}")
 
+    def cadastrar_clientes_bulk(self, records: Iterable[Tuple[str, str, str]]) -> None:
+        """Cadastra vários clientes (nome, cpf, email) e imprime só um resumo."""
+        # Tudo ou nada: se algum registro for inválido, nenhum cliente é inserido.
+        novos = {p.cpf: Cliente(p) for p in (Pessoa(*r) for r in records)}
+        self.clientes.update(novos)
+        print(f"{len(novos)} cliente(s) cadastrado(s).")
+
+    def cadastrar_produtos_bulk(self, records: Iterable[Tuple[str, Union[Decimal, str, int], int]]) -> None:
+        """Cadastra vários produtos (nome, preco, estoque) e imprime só um resumo."""
+        # Tudo ou nada: todos os produtos são validados antes da primeira gravação.
+        novos = [Produto(sys.intern(nome), preco, estoque) for nome, preco, estoque in records]
+        for produto in novos:
+            self._store_produto(produto)
+        print(f"{len(novos)} produto(s) cadastrado(s).")
+
     def criar_pedido(self, cpf: str) -> None:
         cliente = self.clientes.get(cpf)
         if not cliente:
             print("Cliente não encontrado.")
             return
         pedido = Pedido(cliente)
+        # Referências locais usadas no laço (evita LOAD_ATTR repetido a cada item).
+        produtos = self.produtos
+        append_item = pedido.adicionar_item
+        intern = sys.intern
+        # Catálogo renderizado uma única vez; depois só o estoque alterado é reimpresso.
+        catalogo = "\n".join(
+            f"{nome} - Preço: {format_money(produto.preco_cents)} - Estoque: {produto.estoque}"
+            for nome, produto in self._produtos_list
+        )
+        print("Produtos disponíveis:\n" + catalogo)
         while True:
-            print("Produtos disponíveis:")
-            for nome, produto in self.produtos.items():
-                print(f"{nome} - Preço: {produto.preco} - Estoque: {produto.estoque}")
-            nome_produto = input("Digite o nome do produto (ou 'fim' para encerrar): ")
+            nome_produto = intern(input("Digite o nome do produto (ou 'fim' para encerrar): "))
             if nome_produto.lower() == 'fim':
                 break
-            produto = self.produtos.get(nome_produto)
+            produto = produtos.get(nome_produto)
             if not produto:
                 print("Produto não encontrado.")
                 continue
@@ -187,50 +174,106 @@ class Menu:
                 if quantidade > produto.estoque:
                     print("Estoque insuficiente.")
                     continue
-                pedido.adicionar_item(produto, quantidade)
+                append_item(produto, quantidade)
                 produto.estoque -= quantidade
+                print(f"[{nome_produto}] novo estoque: {produto.estoque}")
             except ValueError:
                 print("Quantidade inválida.")
         total = pedido.calcular_total()
-        print(f"Total do pedido: {total}")
+        print(f"Total do pedido: {format_money(total)}")
         self.pedidos.append(pedido)
 
     def listar_pedidos(self) -> None:
+        buf = io.StringIO()
+        w = buf.write
         for idx, pedido in enumerate(self.pedidos, 1):
-            print(f"Pedido {idx} - Cliente: {pedido.cliente.pessoa.nome}")
-            for item in pedido.itens:
-                print(f"  {item.produto.nome} x {item.quantidade} = {item.calcular_total()}")
-            print(f"Total: {pedido.calcular_total()}\n")
+            w(f"Pedido {idx} - Cliente: {pedido.cliente.pessoa.nome}\n")
+            for produto, preco, qtd in pedido.linhas():
+                w(f"  {produto.nome} x {qtd} = {format_money(preco * qtd)}\n")
+            w(f"Total: {format_money(pedido.calcular_total())}\n\n")
+        _out(buf.getvalue())
+        sys.stdout.flush()
+
+    def _build_soa(self) -> List[int]:
+        """
+        Materializa os itens de todos os pedidos em arrays int64 paralelos
+        (preços, quantidades e offsets por pedido) e devolve os totais de
+        cada pedido, em centavos, calculados por _sum_totals.
+        """
+        prices_np: Any
+        qtys_np: Any
+        offsets_np: Any
+        out: Any
+        prices = array("q")
+        qtys = array("q")
+        offsets = array("q", [0])
+        for pedido in self.pedidos:
+            precos_pedido, qtds_pedido = pedido.colunas()
+            prices.extend(precos_pedido)
+            qtys.extend(qtds_pedido)
+            offsets.append(len(prices))
+        if np is not None:
+            prices_np = np.frombuffer(prices, dtype=np.int64)
+            qtys_np = np.frombuffer(qtys, dtype=np.int64)
+            offsets_np = np.frombuffer(offsets, dtype=np.int64)
+            out = np.zeros(len(self.pedidos), dtype=np.int64)
+        else:
+            prices_np, qtys_np, offsets_np = prices, qtys, offsets
+            out = array("q", bytes(8 * len(self.pedidos)))
+        # tolist() existe em ndarray e array.array: o retorno é sempre List[int].
+        totais: List[int] = _sum_totals(prices_np, qtys_np, offsets_np, out).tolist()
+        return totais
+
+    def totais_pedidos(self) -> List[int]:
+        """
+        Relatório em lote: totais (centavos) de todos os pedidos, na ordem de
+        self.pedidos, como lista de int (independe de numpy/numba).
+        """
+        return self._build_soa()
+
+    def _menu_cad_cliente(self) -> None:
+        nome = input("Nome: ")
+        cpf = input("CPF: ")
+        email = input("Email: ")
+        try:
+            self.cadastrar_cliente(nome, cpf, email)
+        except ValueError as erro:
+            _out(f"{erro}\n")
+
+    def _menu_cad_produto(self) -> None:
+        nome = input("Nome do produto: ")
+        preco = input("Preço: ")  # texto repassado ao Produto, que valida e converte
+        try:
+            estoque = int(input("Estoque: "))
+        except ValueError:
+            _out("Estoque inválido.\n")
+            return
+        try:
+            self.cadastrar_produto(nome, preco, estoque)
+        except ValueError as erro:
+            _out(f"{erro}\n")
+
+    def _menu_criar_pedido(self) -> None:
+        cpf = input("CPF do cliente: ")
+        self.criar_pedido(cpf)
+
+    def _menu_exit(self) -> None:
+        _out("Saindo...\n")
+        sys.stdout.flush()
+        self._executando = False
+
+    def _invalid(self) -> None:
+        _out("Opção inválida.\n")
 
     def exibir_menu(self) -> None:
-        while True:
-            print("\n--- Menu E-commerce ---")
-            print("1. Cadastrar cliente")
-            print("2. Cadastrar produto")
-            print("3. Criar pedido")
-            print("4. Listar pedidos")
-            print("0. Sair")
+        actions = self._actions
+        self._executando = True
+        while self._executando:
+            _out(_MENU_BANNER)
+            sys.stdout.flush()
             opcao = input("Escolha uma opção: ")
-            if opcao == "1":
-                nome = input("Nome: ")
-                cpf = input("CPF: ")
-                email = input("Email: ")
-                self.cadastrar_cliente(nome, cpf, email)
-            elif opcao == "2":
-                nome = input("Nome do produto: ")
-                preco = Decimal(input("Preço: "))
-                estoque = int(input("Estoque: "))
-                self.cadastrar_produto(nome, preco, estoque)
-            elif opcao == "3":
-                cpf = input("CPF do cliente: ")
-                self.criar_pedido(cpf)
-            elif opcao == "4":
-                self.listar_pedidos()
-            elif opcao == "0":
-                print("Saindo...")
-                break
-            else:
-                print("Opção inválida.")
+            action = actions.get(opcao)
+            (action or self._invalid)()
 
 
 # =========================
@@ -0,0 +1,271 @@
+# models.py
+# Classes de domínio do E-commerce (Pessoa, Cliente, Produto, ItemPedido, Pedido).
+# Separadas da CLI para poderem ser compiladas AOT com mypyc (ver setup.py);
+# as anotações de atributo no corpo das classes permitem ao mypyc gerar
+# acesso a atributos por offset fixo em vez de __dict__.
+# Sem compilação, o módulo funciona normalmente como Python puro.
+
+import os                       # bytes aleatórios para os identificadores
+import re                       # validação de CPF / email
+from array import array         # colunas int64 compactas dos itens do pedido
+from decimal import Decimal, Context, Inexact, InvalidOperation, ROUND_HALF_EVEN  # representação apropriada de dinheiro
+from typing import Iterator, List, Tuple, Union  # anotações de tipo
+
+_randbytes = os.urandom
+
+# Padrões pré-compilados (evita a consulta ao cache interno de re a cada chamada).
+# Usados com fullmatch: sem "$" (que aceita "\n" final) e só dígitos ASCII.
+_CPF_RE = re.compile(r"[0-9]{11}")
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Maior valor representável nas colunas int64 (array "q") do pedido.
+_INT64_MAX = 2**63 - 1
+
+# Contexto Decimal estreito (12 dígitos) usado só na conversão preço -> centavos.
+# Não altera o contexto global do processo. Inexact é sinalizado como erro para
+# que um preço com dígitos demais nunca seja arredondado em silêncio.
+_DEC_CTX = Context(prec=12, rounding=ROUND_HALF_EVEN, traps=[Inexact])
+
+
+def _to_cents(preco: Decimal) -> int:
+    """Converte um preço Decimal (já validado pelo Produto) em centavos inteiros usando _DEC_CTX."""
+    try:
+        # Decimal * int é suportado diretamente; não é preciso construir Decimal(100).
+        centavos = _DEC_CTX.multiply(preco, 100)
+    except Inexact:
+        raise ValueError("Preço inválido: excede a precisão suportada (12 dígitos).") from None
+    # Inexact limita só os dígitos significativos (1E+20 é exato); limita também
+    # a magnitude a 12 dígitos de centavos.
+    if centavos.adjusted() >= 12:
+        raise ValueError("Preço inválido: valor máximo é 9999999999.99.")
+    return int(_DEC_CTX.to_integral_value(centavos))
+
+
+def format_money(cents: int) -> str:
+    """Formata um valor em centavos (int) como texto, ex.: 1050 -> '10.50'."""
+    sinal = "-" if cents < 0 else ""
+    cents = abs(cents)
+    return f"{sinal}{cents // 100}.{cents % 100:02d}"
+
+
+# =========================
+# CLASSE PESSOA
+# =========================
+class Pessoa:
+    """
+    Representa uma pessoa com atributos básicos.
+    Atributos obrigatórios: nome, cpf, email.
+
+    Tarefas do aluno:
+    - Implementar o construtor (__init__) atribuindo os atributos.
+    - (Opcional) Validar CPF / email.
+      (CPF: 11 dígitos, sem pontuação; email: formato usuario@dominio.tld.)
+    - (Opcional) Criar __str__/__repr__ para facilitar a depuração.
+    """
+
+    __slots__ = ("nome", "cpf", "email")
+
+    nome: str
+    cpf: str
+    email: str
+
+    def __init__(self, nome: str, cpf: str, email: str) -> None:
+        if not _CPF_RE.fullmatch(cpf):
+            raise ValueError("CPF inválido: informe 11 dígitos.")
+        if not _EMAIL_RE.fullmatch(email):
+            raise ValueError("Email inválido.")
+        self.nome = nome
+        self.cpf = cpf
+        self.email = email
+
+    def __repr__(self) -> str:
+        return f"Pessoa(nome={self.nome}, cpf={self.cpf}, email={self.email})"
+
+
+# =========================
+# CLASSE CLIENTE
+# =========================
+class Cliente:
+    """
+    Representa um cliente do e-commerce, associado a uma Pessoa.
+    Atributos: pessoa (objeto Pessoa), id_cliente (str).
+
+    Tarefas do aluno:
+    - Implementar o construtor recebendo uma Pessoa.
+    - Gerar id_cliente com str(uuid.uuid4()).
+      (Aqui: 16 bytes aleatórios em hex, 32 caracteres — não é um UUID;
+      id_cliente_formatado devolve o mesmo valor agrupado com hífens.)
+    - (Opcional) Criar __str__/__repr__.
+    """
+
+    __slots__ = ("pessoa", "id_cliente")
+
+    pessoa: Pessoa
+    id_cliente: str
+
+    def __init__(self, pessoa: Pessoa) -> None:
+        self.pessoa = pessoa
+        self.id_cliente = _randbytes(16).hex()
+
+    @property
+    def id_cliente_formatado(self) -> str:
+        # Agrupamento 8-4-4-4-12 com hífens, formatado apenas quando pedido.
+        h = self.id_cliente
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+    def __repr__(self) -> str:
+        return f"Cliente(id_cliente={self.id_cliente}, pessoa={self.pessoa})"
+
+
+# =========================
+# CLASSE PRODUTO
+# =========================
+class Produto:
+    """
+    Representa um produto disponível para venda.
+    Atributos: nome (str), preco_cents (int, preço em centavos), estoque (int).
+    O preço é recebido como Decimal/str e guardado em centavos inteiros,
+    evitando aritmética Decimal no cálculo de totais.
+
+    Tarefas do aluno:
+    - Implementar o construtor e armazenar os atributos.
+    - (Opcional) Validar: preco >= 0 e estoque >= 0.
+    - (Opcional) Criar __str__/__repr__.
+    - (Opcional) Métodos utilitários (ex.: pode_atender, debitar, creditar) se o enunciado pedir.
+    """
+
+    __slots__ = ("nome", "preco_cents", "estoque")
+
+    nome: str
+    preco_cents: int
+    estoque: int
+
+    def __init__(self, nome: str, preco: Union[Decimal, str, int], estoque: int) -> None:
+        # str/int são convertidos para Decimal; a validação usa o valor exato,
+        # antes do arredondamento para centavos.
+        if not isinstance(preco, Decimal):
+            try:
+                preco = Decimal(preco)
+            except InvalidOperation:
+                raise ValueError(f"Preço inválido: {preco!r}.") from None
+        if not preco.is_finite():
+            raise ValueError("Preço inválido: informe um valor finito.")
+        if preco < 0 or estoque < 0:
+            raise ValueError("Preço e estoque devem ser não-negativos.")
+        if estoque > _INT64_MAX:
+            raise ValueError("Estoque excede o limite suportado (int64).")
+        self.nome = nome
+        self.preco_cents = _to_cents(preco)
+        self.estoque = estoque
+
+    @property
+    def preco(self) -> Decimal:
+        # Conversão para Decimal apenas para exibição/compatibilidade.
+        # scaleb desloca o expoente (exato), sem divisão Decimal.
+        return Decimal(self.preco_cents).scaleb(-2)
+
+    def __repr__(self) -> str:
+        return f"Produto(nome={self.nome}, preco={format_money(self.preco_cents)}, estoque={self.estoque})"
+
+
+# =========================
+# CLASSE ITEMPEDIDO
+# =========================
+class ItemPedido:
+    """
+    Representa um item dentro de um pedido (produto + quantidade).
+    Atributos: produto (Produto), quantidade (int).
+
+    Tarefas do aluno:
+    - Implementar o construtor.
+    - Implementar calcular_total() = produto.preco * quantidade.
+      (O total é devolvido em centavos inteiros; use format_money para exibir.)
+    """
+
+    __slots__ = ("produto", "quantidade")
+
+    produto: Produto
+    quantidade: int
+
+    def __init__(self, produto: Produto, quantidade: int) -> None:
+        if quantidade <= 0:
+            raise ValueError("Quantidade deve ser maior que zero.")
+        self.produto = produto
+        self.quantidade = quantidade
+
+    def calcular_total(self) -> int:
+        return self.produto.preco_cents * self.quantidade
+
+
+# =========================
+# CLASSE PEDIDO
+# =========================
+class Pedido:
+    """
+    Representa um pedido realizado por um cliente.
+    Atributos: cliente (Cliente), itens (List[ItemPedido]).
+    Os itens são guardados em colunas paralelas (structure of arrays):
+    _prices (preço unitário em centavos), _qtys (quantidade) e _produtos.
+
+    Tarefas do aluno:
+    - Implementar o construtor inicializando a lista de itens vazia.
+    - Implementar adicionar_item(produto, quantidade): cria ItemPedido e adiciona à lista.
+      (Aqui os valores vão direto para as colunas; pedido[i] devolve um ItemPedido.)
+    - Implementar calcular_total(): soma dos totais dos itens.
+      (O total é mantido em _total e atualizado em adicionar_item.)
+    - (Opcional) confirmar(): validar estoques e debitar (se fizer parte do enunciado).
+    """
+
+    __slots__ = ("cliente", "_prices", "_qtys", "_produtos", "_total")
+
+    cliente: Cliente
+    _prices: "array[int]"
+    _qtys: "array[int]"
+    _produtos: List[Produto]
+    _total: int
+
+    def __init__(self, cliente: Cliente) -> None:
+        self.cliente = cliente
+        self._prices = array("q")
+        self._qtys = array("q")
+        self._produtos = []
+        self._total = 0  # total acumulado em centavos, atualizado a cada item
+
+    @property
+    def itens(self) -> List[ItemPedido]:
+        # Visão de compatibilidade: reconstrói os ItemPedido a partir das colunas.
+        return [ItemPedido(produto, qtd) for produto, qtd in zip(self._produtos, self._qtys)]
+
+    def linhas(self) -> Iterator[Tuple[Produto, int, int]]:
+        """Itera os itens como (produto, preco_cents, quantidade), sem criar ItemPedido."""
+        return zip(self._produtos, self._prices, self._qtys)
+
+    def colunas(self) -> Tuple["array[int]", "array[int]"]:
+        """Devolve as colunas (preco_cents, quantidade) do pedido; somente leitura."""
+        return self._prices, self._qtys
+
+    def __getitem__(self, indice: int) -> ItemPedido:
+        if not isinstance(indice, int):
+            raise TypeError("Índice de item deve ser inteiro (fatias não são suportadas).")
+        return ItemPedido(self._produtos[indice], self._qtys[indice])
+
+    def adicionar_item(self, produto: Produto, quantidade: int) -> None:
+        if quantidade <= 0:
+            raise ValueError("Quantidade deve ser maior que zero.")
+        preco_cents = produto.preco_cents
+        subtotal = preco_cents * quantidade
+        # Valida tudo antes de tocar nas colunas, para que continuem alinhadas.
+        if (
+            preco_cents > _INT64_MAX
+            or quantidade > _INT64_MAX
+            or subtotal > _INT64_MAX
+            or self._total + subtotal > _INT64_MAX
+        ):
+            raise ValueError("Item excede o limite suportado pelo pedido (int64).")
+        self._prices.append(preco_cents)
+        self._qtys.append(quantidade)
+        self._produtos.append(produto)
+        self._total += subtotal
+
+    def calcular_total(self) -> int:
+        return self._total
@@ -0,0 +1,14 @@
+# setup.py
+# Compilação AOT opcional das classes de domínio (models.py) com mypyc:
+#   pip install mypy
+#   python setup.py build_ext --inplace
+# Sem este passo, models.py roda normalmente como Python puro.
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="ecommerce",
+    py_modules=["Ecommerce"],
+    ext_modules=mypycify(["models.py"]),
+)